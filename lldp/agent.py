@@ -1,16 +1,109 @@
 import binascii
-import socket, select
+import socket
 import time
 import ctypes
+import ctypes.util
+import errno
+import os
 import struct
 import fcntl
+import mmap
+import select
 from .lldpdu import LLDPDU
 from .tlv import *
 
 
-class ifreq(ctypes.Structure):
-    _fields_ = [("ifr_ifrn", ctypes.c_char * 16),
-                ("ifr_flags", ctypes.c_short)]
+RX_BATCH_SIZE = 32
+"""Maximum number of frames fetched from the socket with a single recvmmsg() call"""
+
+RX_FRAME_SIZE = 1518
+"""Size of each receive buffer, large enough for a VLAN-tagged Ethernet frame"""
+
+TX_FRAME_SIZE = 1518
+"""Size of the transmit buffer"""
+
+MSG_WAITFORONE = 0x10000
+
+LLDP_MCAST_PREFIX = b"\x01\x80\xc2\x00\x00"
+"""First five bytes shared by all LLDP multicast addresses"""
+
+LLDP_MCAST_LAST = frozenset((0x00, 0x03, 0x0e))
+"""Last byte of the LLDP multicast addresses 01:80:c2:00:00:00, 01:80:c2:00:00:03 and 01:80:c2:00:00:0e"""
+
+LLDP_MCAST_ADDRESS = LLDP_MCAST_PREFIX + b"\x0e"
+"""Destination address of announced frames (nearest bridge)"""
+
+ETH_TYPE_LLDP = 0x88CC
+
+SO_ATTACH_FILTER = 26
+
+LLDP_FILTER = [
+    (0x28, 0, 0, 12),             # ldh [12]                Load the ethertype
+    (0x15, 0, 1, ETH_TYPE_LLDP),  # jeq #0x88cc, jt 0, jf 1
+    (0x06, 0, 0, 0x00040000),     # ret #262144             Accept the frame
+    (0x06, 0, 0, 0),              # ret #0                  Drop the frame
+]
+"""Classic BPF program attached to the agent's socket, drops all frames not carrying an LLDPDU in the kernel"""
+
+SOL_PACKET = 263
+PACKET_RX_RING = 5
+PACKET_VERSION = 10
+TPACKET_V3 = 2
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1
+
+RING_BLOCK_SIZE = 4096
+RING_BLOCK_NR = 64
+RING_FRAME_SIZE = 2048
+RING_RETIRE_TIMEOUT = 100
+"""Time in ms after which the kernel hands a partially filled ring block to the agent"""
+
+TPACKET_REQ3 = struct.Struct("7I")
+"""struct tpacket_req3: block size, block count, frame size, frame count, block retire timeout, private size, features"""
+
+TPACKET_BLOCK_HDR = struct.Struct("III")
+"""Start of struct tpacket_hdr_v1 (at offset 8 of a ring block): block status, packet count, offset to first packet"""
+
+TPACKET3_HDR = struct.Struct("I8xI8xH")
+"""Relevant fields of struct tpacket3_hdr: offset to the next packet, captured length, offset to the MAC header"""
+
+
+class iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p),
+                ("iov_len", ctypes.c_size_t)]
+
+
+class msghdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(iovec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+
+class mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", msghdr),
+                ("msg_len", ctypes.c_uint)]
+
+
+_libc = None
+
+
+def _load_recvmmsg():
+    """Return the C library's recvmmsg()
+
+    The library is loaded on first use, so importing the package does not depend on a particular libc.
+    """
+    global _libc
+    if _libc is None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(mmsghdr), ctypes.c_uint, ctypes.c_int,
+                                  ctypes.c_void_p]
+        libc.recvmmsg.restype = ctypes.c_int
+        _libc = libc
+    return _libc.recvmmsg
 
 
 class StdoutLogger:
@@ -32,6 +125,9 @@ class LLDPAgent:
     If a frame is received and it is valid its contents will be logged for the administrator.
     """
 
+    _ETH_HDR = struct.Struct("!6s6sH")
+    """Ethernet header: destination address, source address, ethertype"""
+
     def __init__(self, mac_address: bytes, interface_name: str = "", interval=1.0, sock=None, logger=None):
         """LLDP Agent Constructor
 
@@ -49,23 +145,61 @@ class LLDPAgent:
             # Open a socket suitable for transmitting LLDP frames.
             ETH_P_ALL = socket.ntohs(0x0003)
             self.socket = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, ETH_P_ALL)
+
+            # Only let LLDP frames through to user space
+            filter_prog = ctypes.create_string_buffer(b"".join(struct.pack("HBBI", *insn) for insn in LLDP_FILTER))
+            sock_fprog = struct.pack("HL", len(LLDP_FILTER), ctypes.addressof(filter_prog))
+            self.socket.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, sock_fprog)
+
             self.socket.bind((interface_name, 0))
             IFF_PROMISC = 0x100
             SIOCGIFFLAGS = 0x8913
             SIOCSIFFLAGS = 0x8914
-            ifr = ifreq()
-            ifr.ifr_ifrn = interface_name.encode('utf-8')
-            fcntl.ioctl(self.socket.fileno(), SIOCGIFFLAGS, ifr)  # G for Get
-            ifr.ifr_flags |= IFF_PROMISC
-            fcntl.ioctl(self.socket.fileno(), SIOCSIFFLAGS, ifr)  # S for Set
+            # struct ifreq: interface name (16 bytes) followed by the interface flags (short)
+            ifr = bytearray(40)
+            struct.pack_into("16s", ifr, 0, interface_name.encode('utf-8'))
+            fcntl.ioctl(self.socket.fileno(), SIOCGIFFLAGS, ifr, True)  # G for Get
+            flags, = struct.unpack_from("H", ifr, 16)
+            struct.pack_into("H", ifr, 16, flags | IFF_PROMISC)
+            fcntl.ioctl(self.socket.fileno(), SIOCSIFFLAGS, ifr, True)  # S for Set
+
+            # Let the kernel place received frames directly into a ring buffer shared with the agent
+            self.socket.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V3)
+            self.socket.setsockopt(SOL_PACKET, PACKET_RX_RING,
+                                   TPACKET_REQ3.pack(RING_BLOCK_SIZE, RING_BLOCK_NR, RING_FRAME_SIZE,
+                                                     RING_BLOCK_SIZE * RING_BLOCK_NR // RING_FRAME_SIZE,
+                                                     RING_RETIRE_TIMEOUT, 0, 0))
+            self._ring = mmap.mmap(self.socket.fileno(), RING_BLOCK_SIZE * RING_BLOCK_NR,
+                                   mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+            self._ring_view = memoryview(self._ring)
+            self._ring_block = 0
+            self._ring_done = []
+            self._poll = select.poll()
+            self._poll.register(self.socket, select.POLLIN | select.POLLERR)
 
         else:
             self.socket = sock
+            self._ring = None
 
         self.interface_name = interface_name
         self.mac_address = mac_address
         self.announce_interval = interval  # in seconds
         self.logger = StdoutLogger() if logger is None else logger
+        self._txbuf = bytearray(TX_FRAME_SIZE)
+        self._announce_frame = self._build_announce_frame()
+
+        if self._ring is None:
+            # Receive buffers and message headers for recvmmsg(), allocated once and reused for every batch
+            self._recvmmsg = _load_recvmmsg()
+            self._rx_buffers = [bytearray(RX_FRAME_SIZE) for _ in range(RX_BATCH_SIZE)]
+            self._rx_views = [memoryview(buf) for buf in self._rx_buffers]
+            self._rx_iovecs = (iovec * RX_BATCH_SIZE)()
+            self._rx_msgs = (mmsghdr * RX_BATCH_SIZE)()
+            for i, buf in enumerate(self._rx_buffers):
+                self._rx_iovecs[i].iov_base = ctypes.addressof((ctypes.c_char * RX_FRAME_SIZE).from_buffer(buf))
+                self._rx_iovecs[i].iov_len = RX_FRAME_SIZE
+                self._rx_msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._rx_iovecs[i])
+                self._rx_msgs[i].msg_hdr.msg_iovlen = 1
 
     def run(self, run_once: bool = False):
         """Agent Loop
@@ -88,59 +222,129 @@ class LLDPAgent:
         received = False
         t_previous = time.time()
         try:
+            # Without a receive ring, block in recvmmsg() for at most one announce interval
+            self.socket.settimeout(None)
+            sec = int(self.announce_interval)
+            # A zero timeval disables the timeout, so wait at least one microsecond
+            usec = max(int((self.announce_interval - sec) * 1e6), 0 if sec else 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("ll", sec, usec))
+
             while not run_once or not received:
-                r, _, _ = select.select([self.socket], [], [], self.announce_interval)
-                if len(r) > 0:
-                    # Frames have been received by the network card
+                # Drain everything queued on the socket before checking the announce timer again
+                frames = self.receive()
+                while frames:
+                    for data in frames:
+                        if self.process_frame(data):
+                            received = True
+                            if run_once:
+                                break
+                    if len(frames) < RX_BATCH_SIZE or (run_once and received):
+                        break
+                    frames = self.receive(wait=False)
+
+                # Announce if the time is right
+                t_now = time.time()
+                if t_now - t_previous > self.announce_interval:
+                    self.announce()
+                    t_previous = t_now
+
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Clean up
+            # The ring is unmapped once the last view of a received frame is gone
+            self._ring = None
+            self._ring_view = None
+            self.socket.close()
 
-                    # Get the next frame
-                    data = r[0].recv(4096)
+    def receive(self, wait: bool = True) -> list:
+        """Receive a batch of frames
 
-                    # Check format and extract LLDPDU (raw bytes)
-                    dest_addr = struct.unpack_from("6s", data, 0)
+        Waits until at least one frame has arrived (or the announce interval expired) and returns all frames
+        that are available at that point.
 
-                    # print(binascii.hexlify(dest_addr[0]))
+        Frames are read from the socket's receive ring if the agent opened the socket itself. Otherwise up to
+        `RX_BATCH_SIZE` frames are fetched using a single recvmmsg() call.
 
-                    if dest_addr[0] != bytes([0x01, 0x80, 0xc2, 0x00, 0x00, 0x00]) and dest_addr[0] != bytes(
-                            [0x01, 0x80, 0xc2, 0x00, 0x00, 0x03]) and dest_addr[0] != bytes(
-                            [0x01, 0x80, 0xc2, 0x00, 0x00, 0x0e]):
-                        print("Error: invalid destination address!")
-                        continue
+        The returned frames are only valid until the next call.
 
-                    src_addr = struct.unpack_from("6s", data, 6)
+        Parameters:
+            wait (bool): Block until a frame arrives. If False, return immediately if no frames are queued
+        """
+        if self._ring is not None:
+            return self._receive_ring(wait)
 
-                    # print(binascii.hexlify(src_addr[0]))
+        flags = MSG_WAITFORONE if wait else socket.MSG_DONTWAIT
+        n = self._recvmmsg(self.socket.fileno(), self._rx_msgs, RX_BATCH_SIZE, flags, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
 
-                    if src_addr[0] == self.mac_address:
-                        print("Error: message origin is self!")
-                        continue
+        return [self._rx_views[i][:self._rx_msgs[i].msg_len] for i in range(n)]
 
-                    eth_type = struct.unpack_from("!H", data, 12)
+    def _receive_ring(self, wait: bool) -> list:
+        """Receive all frames from the ring blocks the kernel has handed over to the agent
 
-                    # print(hex(eth_type[0]))
+        Blocks are handed back to the kernel on the next call, once the frames returned from them have been processed.
+        """
+        ring = self._ring_view
 
-                    if eth_type[0] != 0x88CC:
-                        print("Error: wrong ethertype!")
-                        continue
+        for block in self._ring_done:
+            struct.pack_into("I", ring, block + 8, TP_STATUS_KERNEL)
+        self._ring_done.clear()
 
-                    # Instantiate LLDPDU object from raw bytes
-                    lldpdu = LLDPDU.from_bytes(data[14:len(data)])
+        status, num_pkts, offset = TPACKET_BLOCK_HDR.unpack_from(ring, self._ring_block + 8)
+        if not status & TP_STATUS_USER:
+            if not wait:
+                return []
+            self._poll.poll(self.announce_interval * 1000)
+            status, num_pkts, offset = TPACKET_BLOCK_HDR.unpack_from(ring, self._ring_block + 8)
 
-                    # Log contents
-                    self.logger.log(str(lldpdu))
-                    received = True
+        frames = []
+        while status & TP_STATUS_USER and len(self._ring_done) < RING_BLOCK_NR:
+            block = self._ring_block
+            pkt = block + offset
+            for _ in range(num_pkts):
+                next_offset, snaplen, mac = TPACKET3_HDR.unpack_from(ring, pkt)
+                frames.append(ring[pkt + mac:pkt + mac + snaplen])
+                pkt += next_offset
 
-                # Announce if the time is right
-                t_now = time.time()
-                if t_now - t_previous > self.announce_interval:
-                    self.announce()
-                    t_previous = t_now
+            self._ring_done.append(block)
+            self._ring_block = (block + RING_BLOCK_SIZE) % (RING_BLOCK_SIZE * RING_BLOCK_NR)
+            status, num_pkts, offset = TPACKET_BLOCK_HDR.unpack_from(ring, self._ring_block + 8)
 
-        except KeyboardInterrupt:
-            pass
-        finally:
-            # Clean up
-            self.socket.close()
+        return frames
+
+    def process_frame(self, data) -> bool:
+        """Process a received frame
+
+        Checks if `data` is a valid LLDP frame and, if so, logs the contained LLDPDU.
+
+        Returns True if an LLDPDU has been logged, False if the frame has been ignored.
+        """
+        # Check format and extract LLDPDU (raw bytes)
+        dest_addr, src_addr, eth_type = self._ETH_HDR.unpack_from(data)
+
+        if dest_addr[:5] != LLDP_MCAST_PREFIX or dest_addr[5] not in LLDP_MCAST_LAST:
+            print("Error: invalid destination address!")
+            return False
+
+        if src_addr == self.mac_address:
+            print("Error: message origin is self!")
+            return False
+
+        if eth_type != ETH_TYPE_LLDP:
+            print("Error: wrong ethertype!")
+            return False
+
+        # Instantiate LLDPDU object from raw bytes
+        lldpdu = LLDPDU.from_bytes(data[self._ETH_HDR.size:])
+
+        # Log contents
+        self.logger.log(str(lldpdu))
+        return True
 
     def announce(self):
         """Announce the agent
@@ -151,6 +355,15 @@ class LLDPAgent:
             * the agent's MAC address as its chassis id
             * the agent's interface name as port id
             * a TTL of 60 seconds
+
+        None of these change while the agent is running, so the frame is built once by the constructor.
+        """
+        self.socket.send(self._announce_frame)
+
+    def _build_announce_frame(self) -> memoryview:
+        """Build the Ethernet frame sent by `LLDPAgent.announce()`
+
+        The frame is packed into the transmit buffer. Returns a view of the part of the buffer holding the frame.
         """
 
         # Construct LLDPDU
@@ -159,25 +372,11 @@ class LLDPAgent:
         ttlive_tlv = TTLTLV(60)
         # end_tlv = EndOfLLDPDUTLV()
         lldpdu = LLDPDU(chassis_tlv, port_tlv, ttlive_tlv)
-
-        # Construct Ethernet Frame
-        dst_addr = bytearray([0x01, 0x80, 0xc2, 0x00, 0x00, 0x0e])
-
         payload = lldpdu.__bytes__()
 
-        ethertype = 0x88CC
-
-        eth_header = struct.pack('!6s6sH', dst_addr, self.mac_address, ethertype)
-
-        # checksum = binascii.crc32(bytearray(eth_header) + bytearray(payload))
-
-        # print(binascii.hexlify(bytearray(eth_header) + bytearray(payload)))
-
-        # print(binascii.hexlify(checksum.to_bytes(4, byteorder='big')))
-
-        frame = bytearray(eth_header) + bytearray(payload)  # + checksum.to_bytes(4, byteorder='big')
-
-        # print(binascii.hexlify(frame))
+        # Construct Ethernet Frame
+        self._ETH_HDR.pack_into(self._txbuf, 0, LLDP_MCAST_ADDRESS, self.mac_address, ETH_TYPE_LLDP)
+        frame_len = self._ETH_HDR.size + len(payload)
+        self._txbuf[self._ETH_HDR.size:frame_len] = payload
 
-        # Send frame
-        self.socket.send(frame)
+        return memoryview(self._txbuf)[:frame_len]
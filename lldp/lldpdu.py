@@ -1,5 +1,20 @@
-from lldp.tlv import EndOfLLDPDUTLV, ChassisIdTLV, PortIdTLV, TTLTLV, PortDescriptionTLV, SystemNameTLV, SystemDescriptionTLV, SystemCapabilitiesTLV, ManagementAddressTLV, OrganizationallySpecificTLV
-from lldp.tlv import TLV
+import struct
+
+from lldp.tlv import EndOfLLDPDUTLV
+from lldp.tlv import TLV, _HEADER_STRUCT
+
+# Plain int copies of the TLV types, comparing against these avoids going through the IntEnum machinery
+_T_END = int(TLV.Type.END_OF_LLDPDU)
+_T_CHASSIS = int(TLV.Type.CHASSIS_ID)
+_T_PORT = int(TLV.Type.PORT_ID)
+_T_TTL = int(TLV.Type.TTL)
+
+_CHASSIS_ID_BIT = 1 << _T_CHASSIS
+_PORT_ID_BIT = 1 << _T_PORT
+_TTL_BIT = 1 << _T_TTL
+
+MANDATORY_MASK = _CHASSIS_ID_BIT | _PORT_ID_BIT | _TTL_BIT
+"""Bitmask of the TLV types every LLDPDU has to include"""
 
 
 class LLDPDU:
@@ -25,6 +40,9 @@ class LLDPDU:
         self.length = 0
         self.__tlvs = []
         """List of included TLVs"""
+        self._present = 0
+        """Bitmask of included TLV types (bit n is set if a TLV of type n has been appended)"""
+        self._has_end = False
 
         if len(tlvs) > 0:
             for tlv in tlvs:
@@ -36,10 +54,7 @@ class LLDPDU:
 
     def __bytes__(self) -> bytes:
         """Get the byte representation of the LLDPDU"""
-        res = b""
-        for tlv in self.__tlvs:
-            res += bytes(tlv)
-        return res
+        return b"".join([tlv._packed for tlv in self.__tlvs])
 
     def __getitem__(self, item: int) -> TLV:
         """Get the TLV at position `item`"""
@@ -62,102 +77,78 @@ class LLDPDU:
         `ValueError`. Conditions for specific TLVs are detailed in each TLV's class description.
         """
 
-        if len(tlv.__bytes__()) + self.length > 1500:
+        plen = tlv._plen
+        if self.length + plen > 1500:
             raise ValueError
 
-        if any(isinstance(x, EndOfLLDPDUTLV) for x in self.__tlvs):
+        if self._has_end:
+            raise ValueError
+
+        present = self._present
+        tlv_type = tlv.type
+        if tlv_type == _T_CHASSIS:
+            if present & _CHASSIS_ID_BIT:
+                raise ValueError
+        elif tlv_type == _T_PORT:
+            if (present & (_PORT_ID_BIT | _CHASSIS_ID_BIT)) != _CHASSIS_ID_BIT:
+                raise ValueError
+        elif tlv_type == _T_TTL:
+            if (present & MANDATORY_MASK) != (_CHASSIS_ID_BIT | _PORT_ID_BIT):
+                raise ValueError
+        elif (present & MANDATORY_MASK) != MANDATORY_MASK:
             raise ValueError
-        else:
-            if tlv.type == TLV.Type.CHASSIS_ID:
-                if any(isinstance(x, ChassisIdTLV) for x in self.__tlvs):
-                    raise ValueError
-            elif tlv.type == TLV.Type.PORT_ID:
-                if any(isinstance(x, PortIdTLV) for x in self.__tlvs) or not any(isinstance(x, ChassisIdTLV) for x in self.__tlvs):
-                    raise ValueError
-            elif tlv.type == TLV.Type.TTL:
-                if any(isinstance(x, TTLTLV) for x in self.__tlvs) or not any(isinstance(x, ChassisIdTLV) for x in self.__tlvs) or not any(isinstance(x, PortIdTLV) for x in self.__tlvs):
-                    raise ValueError
-            else:
-                if not any(isinstance(x, ChassisIdTLV) for x in self.__tlvs) or not any(
-                        isinstance(x, PortIdTLV) for x in self.__tlvs) or not any(
-                        isinstance(x, TTLTLV) for x in self.__tlvs):
-                    raise ValueError
 
         self.__tlvs.append(tlv)
-        self.length += len(tlv.__bytes__())
+        self._present = present | (1 << tlv_type)
+        if tlv_type == _T_END:
+            self._has_end = True
+        self.length += plen
 
     def complete(self):
         """Check if LLDPDU is complete.
 
         An LLDPDU is complete when it includes at least the mandatory TLVs (Chassis ID, Port ID, TTL).
         """
-        if any(isinstance(x, ChassisIdTLV) for x in self.__tlvs) and any(
-                isinstance(x, PortIdTLV) for x in self.__tlvs) and any(isinstance(x, TTLTLV) for x in self.__tlvs):
-            return True
-        else:
-            return False
+        return (self._present & MANDATORY_MASK) == MANDATORY_MASK
 
     @staticmethod
     def from_bytes(data: bytes):
         """Create an LLDPDU instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed LLDPDU
+            data (bytes, bytearray or memoryview): The packed LLDPDU
 
         Raises a value error if the provided TLV is of unknown type. Apart from that validity checks are left to the
         subclass.
         """
-        cur_idx = 0
+        mv = memoryview(data)
+        end = len(mv)
+        parsers = TLV._PAYLOAD_DISPATCH
+        unpack_header = _HEADER_STRUCT.unpack_from
 
         lldpdu = LLDPDU()
+        append = lldpdu.append
 
-        while cur_idx < (len(data) + 1):
-            tlv_type = (data[cur_idx] >> 1) & 0x7F
-            tlv_len = ((data[cur_idx] & 1) << 8) | data[cur_idx + 1]
+        # The loop runs once per TLV, so everything it touches is bound to a local name
+        cur_idx = 0
+        while cur_idx < end:
+            try:
+                hdr, = unpack_header(mv, cur_idx)
+            except struct.error:
+                # A single trailing byte, too short for a TLV header
+                raise ValueError
+            tlv_type = hdr >> 9
+            next_idx = cur_idx + (hdr & 0x1FF) + 2
 
-            if (cur_idx + tlv_len + 2) > len(data):
+            if next_idx > end:
                 raise ValueError
-            if tlv_type == TLV.Type.END_OF_LLDPDU:
-                end_tlv = EndOfLLDPDUTLV()
-                lldpdu.append(end_tlv)
-                cur_idx += tlv_len + 2
+            if tlv_type == _T_END:
+                append(EndOfLLDPDUTLV())
                 break
-            elif tlv_type == TLV.Type.CHASSIS_ID:
-                chassis_tlv = ChassisIdTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(chassis_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.PORT_ID:
-                port_tlv = PortIdTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(port_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.TTL:
-                ttlive_tlv = TTLTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(ttlive_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.PORT_DESCRIPTION:
-                port_desc_tlv = PortDescriptionTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(port_desc_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.SYSTEM_NAME:
-                name_tlv = SystemNameTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(name_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.SYSTEM_DESCRIPTION:
-                desc_tlv = SystemDescriptionTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(desc_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.SYSTEM_CAPABILITIES:
-                cap_tlv = SystemCapabilitiesTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(cap_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.MANAGEMENT_ADDRESS:
-                man_tlv = ManagementAddressTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(man_tlv)
-                cur_idx += tlv_len + 2
-            elif tlv_type == TLV.Type.ORGANIZATIONALLY_SPECIFIC:
-                org_tlv = OrganizationallySpecificTLV.from_bytes(data[cur_idx:cur_idx + tlv_len + 2])
-                lldpdu.append(org_tlv)
-                cur_idx += tlv_len + 2
-            else:
+
+            parser = parsers.get(tlv_type)
+            if parser is None:
                 raise ValueError
+            append(parser(mv[cur_idx + 2:next_idx]))
+            cur_idx = next_idx
         return lldpdu
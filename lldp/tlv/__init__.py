@@ -1,4 +1,4 @@
-from .tlv import TLV
+from .tlv import TLV, _HEADER_STRUCT, _parse_header
 from .chassisid_tlv import ChassisIdTLV
 from .eolldpdu_tlv import EndOfLLDPDUTLV
 from .managementaddress_tlv import ManagementAddressTLV
@@ -7,3 +7,19 @@ from .portid_tlv import PortIdTLV
 from .systemcapabilities_tlv import SystemCapabilitiesTLV
 from .ttl_tlv import TTLTLV
 from .string_tlv import SystemNameTLV, SystemDescriptionTLV, PortDescriptionTLV
+
+TLV._PAYLOAD_DISPATCH = {
+    int(TLV.Type.CHASSIS_ID):                ChassisIdTLV._from_payload,
+    int(TLV.Type.PORT_ID):                   PortIdTLV._from_payload,
+    int(TLV.Type.TTL):                       TTLTLV._from_payload,
+    int(TLV.Type.PORT_DESCRIPTION):          PortDescriptionTLV._from_payload,
+    int(TLV.Type.SYSTEM_NAME):               SystemNameTLV._from_payload,
+    int(TLV.Type.SYSTEM_DESCRIPTION):        SystemDescriptionTLV._from_payload,
+    int(TLV.Type.SYSTEM_CAPABILITIES):       SystemCapabilitiesTLV._from_payload,
+    int(TLV.Type.MANAGEMENT_ADDRESS):        ManagementAddressTLV._from_payload,
+    int(TLV.Type.ORGANIZATIONALLY_SPECIFIC): OrganizationallySpecificTLV._from_payload
+}
+"""Maps raw TLV types to the _from_payload() method of the respective TLV class
+
+End of LLDPDU TLVs have no value and are not included.
+"""
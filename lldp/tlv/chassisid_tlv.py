@@ -2,7 +2,9 @@ import struct
 from enum import IntEnum
 from ipaddress import ip_address, IPv4Address, IPv6Address
 
-from lldp.tlv import TLV
+from lldp.tlv import TLV, _parse_header
+
+_T_CHASSIS = int(TLV.Type.CHASSIS_ID)
 
 
 class ChassisIdTLV(TLV):
@@ -89,6 +91,8 @@ class ChassisIdTLV(TLV):
             https://www.iana.org/assignments/address-family-numbers/address-family-numbers.xhtml
     """
 
+    __slots__ = ()
+
     class Subtype(IntEnum):
         CHASSIS_COMPONENT = 1
         INTERFACE_ALIAS = 2
@@ -115,36 +119,20 @@ class ChassisIdTLV(TLV):
         self.subtype = subtype
         self.value = id
 
-        if subtype == ChassisIdTLV.Subtype.MAC_ADDRESS and not len(id) == 6:
+        if subtype == ChassisIdTLV.Subtype.MAC_ADDRESS and len(id) != 6:
             raise ValueError
 
         if isinstance(id, bytes):
-            self.bytes = bytearray(subtype.to_bytes(1, byteorder='big')) + bytearray(id)
+            self.bytes = struct.pack(f"!B{len(id)}s", subtype, id)
         elif isinstance(id, IPv4Address):
-            self.bytes = bytearray(subtype.to_bytes(1, byteorder='big')) + bytearray(
-                (1).to_bytes(1, 'big')) + bytearray(ip_address(id).packed)
+            self.bytes = struct.pack("!BB4s", subtype, 1, id.packed)
         elif isinstance(id, IPv6Address):
-            self.bytes = bytearray(subtype.to_bytes(1, byteorder='big')) + bytearray(
-                (2).to_bytes(1, 'big')) + bytearray(ip_address(id).packed)
+            self.bytes = struct.pack("!BB16s", subtype, 2, id.packed)
         else:
-            self.bytes = bytearray(subtype.to_bytes(1, byteorder='big')) + bytearray(id, 'utf-8')
+            encoded = id.encode('utf-8')
+            self.bytes = struct.pack(f"!B{len(encoded)}s", subtype, encoded)
 
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -153,43 +141,72 @@ class ChassisIdTLV(TLV):
         """
         return f"ChassisIdTLV({self.subtype}, {self.value})"
 
+    @classmethod
+    def _wrap(cls, subtype: Subtype, value, raw: bytes):
+        """Create a TLV instance around an already validated TLV value.
+
+        Used by `_from_payload()` to skip the constructor, which would only pack the decoded value into the bytes that
+        were just parsed.
+        """
+        tlv = cls.__new__(cls)
+        tlv.type = TLV.Type.CHASSIS_ID
+        tlv.subtype = subtype
+        tlv.value = value
+        tlv.bytes = raw
+        tlv._pack()
+        return tlv
+
     @staticmethod
     def from_bytes(data: TLV.ByteType):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
-
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
 
-        if not tlv_type == TLV.Type.CHASSIS_ID:
+        if tlv_type != _T_CHASSIS:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
-
-        if not len(data) == length + 2:
+        if len(data) != length + 2:
             raise ValueError
 
-        addr_subtype = data[2]
+        return ChassisIdTLV._from_payload(memoryview(data)[2:])
+
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
 
-        if addr_subtype == ChassisIdTLV.Subtype.MAC_ADDRESS:
-            if not length == 7:
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        raw = bytes(payload)
+        addr_subtype = _SUBTYPE_CACHE.get(raw[0]) if raw else None
+
+        if addr_subtype is None:
+            raise ValueError
+        elif addr_subtype == ChassisIdTLV.Subtype.MAC_ADDRESS:
+            if len(raw) != 7:
                 raise ValueError
-            tlv = ChassisIdTLV(ChassisIdTLV.Subtype(data[2]), bytes(data[3:len(data)]))
+            value = raw[1:]
         elif addr_subtype == ChassisIdTLV.Subtype.NETWORK_ADDRESS:
-            ip_addr = ip_address(data[4:len(data)])
-            if data[3] == 1 and not ip_addr.version == 4:
-                raise ValueError
-            elif data[3] == 2 and not ip_addr.version == 6:
+            value = ip_address(raw[2:])
+            if not (raw[1] == 1 and value.version == 4 or raw[1] == 2 and value.version == 6):
                 raise ValueError
-            tlv = ChassisIdTLV(ChassisIdTLV.Subtype(data[2]), ip_addr)
         else:
-            tlv = ChassisIdTLV(ChassisIdTLV.Subtype(data[2]), data[3:len(data)].decode('utf-8'))
+            value = raw[1:].decode('utf-8')
 
-        return tlv
+        return ChassisIdTLV._wrap(addr_subtype, value, raw)
+
+
+_SUBTYPE_CACHE = {m.value: m for m in ChassisIdTLV.Subtype}
+"""Maps raw subtype values to `ChassisIdTLV.Subtype` members, avoids the slow enum constructor when parsing"""
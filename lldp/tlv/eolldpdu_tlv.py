@@ -23,11 +23,16 @@ class EndOfLLDPDUTLV(TLV):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Constructor"""
         self.type = TLV.Type.END_OF_LLDPDU
+        self.subtype = None
         self.value = None
         self.bytes = bytearray([0x0, 0x0])
+        self._packed = b'\x00\x00'
+        self._plen = 2
 
     def __bytes__(self):
         """Return the byte representation of the TLV.
@@ -35,7 +40,7 @@ class EndOfLLDPDUTLV(TLV):
         This method must return bytes. Returning a bytearray will raise a TypeError.
         See `TLV.__bytes__()` for more information.
         """
-        return b'\x00\x00'
+        return self._packed
 
     def __len__(self):
         """Return the length of the TLV value.
@@ -57,7 +62,7 @@ class EndOfLLDPDUTLV(TLV):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
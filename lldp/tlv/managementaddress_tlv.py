@@ -1,8 +1,10 @@
-from lldp.tlv import TLV
+from lldp.tlv import TLV, _parse_header
 from ipaddress import ip_address, IPv4Address, IPv6Address
 from enum import IntEnum
 import struct
 
+_T_MGMT_ADDR = int(TLV.Type.MANAGEMENT_ADDRESS)
+
 
 class ManagementAddressTLV(TLV):
     """Management Address TLV
@@ -86,6 +88,8 @@ class ManagementAddressTLV(TLV):
             b'\x00\x08\x15'
     """
 
+    __slots__ = ('oid', 'ifnum')
+
     class IFNumberingSubtype(IntEnum):
         UNKNOWN = 1
         IF_INDEX = 2
@@ -115,31 +119,12 @@ class ManagementAddressTLV(TLV):
         elif isinstance(address, IPv6Address):
             addr_subtype = 2
         assert addr_subtype != 0
-        self.bytes = bytearray(struct.pack("!BB", int((address.max_prefixlen / 8) + 1), addr_subtype))
-        self.bytes += bytearray(address.packed)
-        self.bytes += bytearray(struct.pack("!BI", ifsubtype, interface_number))
-        if oid is not None:
-            self.bytes += bytearray(len(oid).to_bytes(1, 'big'))
-            self.bytes += bytearray(oid)
-        else:
-            self.bytes += bytearray((0).to_bytes(1, 'big'))
+        packed = address.packed
+        oid_bytes = b"" if oid is None else oid
+        self.bytes = struct.pack(f"!BB{len(packed)}sBIB{len(oid_bytes)}s", len(packed) + 1, addr_subtype, packed,
+                                 ifsubtype, interface_number, len(oid_bytes), oid_bytes)
         self.ifnum = interface_number
-
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -148,39 +133,80 @@ class ManagementAddressTLV(TLV):
         """
         return f"ManagementAddressTLV({self.value}, {self.ifnum}, {self.subtype}, {self.oid})"
 
+    @classmethod
+    def _wrap(cls, address, interface_number: int, ifsubtype: IFNumberingSubtype, oid, raw: bytes):
+        """Create a TLV instance around an already validated TLV value.
+
+        Used by `_from_payload()` to skip the constructor, which would only pack the decoded fields into the bytes
+        that were just parsed.
+        """
+        tlv = cls.__new__(cls)
+        tlv.type = TLV.Type.MANAGEMENT_ADDRESS
+        tlv.subtype = ifsubtype
+        tlv.value = address
+        tlv.oid = oid
+        tlv.ifnum = interface_number
+        tlv.bytes = raw
+        tlv._pack()
+        return tlv
+
     @staticmethod
     def from_bytes(data: TLV.ByteType):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
+
+        if tlv_type != _T_MGMT_ADDR:
+            raise ValueError
 
-        if not tlv_type == TLV.Type.MANAGEMENT_ADDRESS:
+        if len(data) != length + 2:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
+        return ManagementAddressTLV._from_payload(memoryview(data)[2:])
 
-        if not len(data) == length + 2:
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        raw = bytes(payload)
+        if not raw:
+            raise ValueError
+        addr_len = raw[0] - 1
+        if addr_len < 0 or len(raw) < 8 + addr_len:
+            raise ValueError
+        oid_len = raw[7 + addr_len]
+        oid_end = 8 + addr_len + oid_len
+        if oid_end != len(raw):
+            raise ValueError
+        ifsubtype = _IFSUBTYPE_CACHE.get(raw[2 + addr_len])
+        if ifsubtype is None:
             raise ValueError
 
-        addr_len = data[2] - 1
-        oid_len = data[9 + addr_len]
-
-        if oid_len == 0:
-            tlv = ManagementAddressTLV(ip_address(data[4:4 + addr_len]),
-                                       (struct.unpack_from("!I", data, 5 + addr_len))[0],
-                                       ManagementAddressTLV.IFNumberingSubtype(data[4 + addr_len]),
-                                       None)
-        else:
-            tlv = ManagementAddressTLV(ip_address(data[4:4 + addr_len]),
-                                       (struct.unpack_from("!I", data, 5 + addr_len))[0],
-                                       ManagementAddressTLV.IFNumberingSubtype(data[4 + addr_len]),
-                                       data[10 + addr_len: 10 + addr_len + oid_len])
-        return tlv
+        address = ip_address(raw[2:2 + addr_len])
+        if not (raw[1] == 1 and address.version == 4 or raw[1] == 2 and address.version == 6):
+            raise ValueError
+
+        return ManagementAddressTLV._wrap(address,
+                                          struct.unpack_from("!I", raw, 3 + addr_len)[0],
+                                          ifsubtype,
+                                          raw[8 + addr_len:oid_end] if oid_len else None,
+                                          raw)
+
+
+_IFSUBTYPE_CACHE = {m.value: m for m in ManagementAddressTLV.IFNumberingSubtype}
+"""Maps raw interface numbering subtype values to enum members, avoids the slow enum constructor when parsing"""
@@ -1,4 +1,10 @@
-from lldp.tlv import TLV
+from lldp.tlv import TLV, _parse_header
+import struct
+
+_T_ORG = int(TLV.Type.ORGANIZATIONALLY_SPECIFIC)
+
+_HEADER32_STRUCT = struct.Struct("!I")
+"""Precompiled format of the OUI and subtype, read as one 32 bit value"""
 
 
 class OrganizationallySpecificTLV(TLV):
@@ -33,39 +39,51 @@ class OrganizationallySpecificTLV(TLV):
     The subtype should be a unique subtype value assigned by the defining organization.
     """
 
-    def __init__(self, oui: TLV.ByteType, subtype: TLV.ByteType, value):
+    __slots__ = ('oui', '_header32')
+
+    def __init__(self, oui: TLV.ByteType, subtype, value):
         """Constructor
 
         Parameters:
             oui (bytes or bytearray): The OUI. See above
-            subtype (bytes or bytearray): The organizationally defined subtype
+            subtype (bytes, bytearray or int): The organizationally defined subtype
             value (any): The value
-        """
-        self.type = TLV.Type.ORGANIZATIONALLY_SPECIFIC
-        self.oui = oui
-        self.subtype = subtype
-        if isinstance(value, str):
-            self.value = bytearray(value, 'utf-8')
-            self.bytes = bytearray(oui) + bytearray(subtype) + bytearray(value, 'utf-8')
-        else:
-            self.value = bytearray(value)
-            self.bytes = bytearray(oui) + bytearray(subtype) + bytearray(value)
 
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
+        Raises a `ValueError` if the OUI is not 3 bytes long or the subtype does not fit into one byte.
         """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
+        if isinstance(subtype, int):
+            subtype_value = subtype
+        elif len(subtype) == 1:
+            subtype_value = subtype[0]
+        else:
+            raise ValueError
+        if len(oui) != 3 or not 0 <= subtype_value <= 255:
+            raise ValueError
 
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
+        self.type = TLV.Type.ORGANIZATIONALLY_SPECIFIC
+        self.oui = bytes(oui)
+        self.subtype = bytes((subtype_value,))
+        self._header32 = (int.from_bytes(oui, 'big') << 8) | subtype_value
+        self.value = value.encode('utf-8') if isinstance(value, str) else bytes(value)
+        self.bytes = b"".join((_HEADER32_STRUCT.pack(self._header32), self.value))
+        self._pack()
+
+    @classmethod
+    def _wrap(cls, header32: int, value: bytes, raw: bytes):
+        """Create a TLV instance around an already validated TLV value.
+
+        Used by `_from_payload()` to skip the constructor, which would only pack the decoded fields into the bytes
+        that were just parsed.
         """
-        return super().__len__()
+        tlv = cls.__new__(cls)
+        tlv.type = TLV.Type.ORGANIZATIONALLY_SPECIFIC
+        tlv.oui = raw[0:3]
+        tlv.subtype = raw[3:4]
+        tlv._header32 = header32
+        tlv.value = value
+        tlv.bytes = raw
+        tlv._pack()
+        return tlv
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -79,22 +97,37 @@ class OrganizationallySpecificTLV(TLV):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
+
+        if tlv_type != _T_ORG:
+            raise ValueError
 
-        if not tlv_type == TLV.Type.ORGANIZATIONALLY_SPECIFIC:
+        if len(data) != length + 2:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
+        return OrganizationallySpecificTLV._from_payload(memoryview(data)[2:])
+
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
 
-        if not len(data) == length + 2:
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        if len(payload) < 4:
             raise ValueError
 
-        tlv = OrganizationallySpecificTLV(data[2:5], data[5].to_bytes(1, 'big'), data[6:len(data)])
-        return tlv
+        raw = bytes(payload)
+        header32, = _HEADER32_STRUCT.unpack_from(raw)
+        return OrganizationallySpecificTLV._wrap(header32, raw[4:], raw)
@@ -1,4 +1,8 @@
-from lldp.tlv import TLV
+from lldp.tlv import TLV, _parse_header
+
+_T_PORT_DESC = int(TLV.Type.PORT_DESCRIPTION)
+_T_SYS_DESC = int(TLV.Type.SYSTEM_DESCRIPTION)
+_T_SYS_NAME = int(TLV.Type.SYSTEM_NAME)
 
 
 class PortDescriptionTLV(TLV):
@@ -26,26 +30,14 @@ class PortDescriptionTLV(TLV):
                                                 0 - 255 byte
     """
 
+    __slots__ = ()
+
     def __init__(self, description: str):
         self.type = TLV.Type.PORT_DESCRIPTION
+        self.subtype = None
         self.value = description
-        self.bytes = bytearray(description, 'utf-8')
-
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self.bytes = description.encode('utf-8')
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -59,25 +51,35 @@ class PortDescriptionTLV(TLV):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
 
-        if not tlv_type == TLV.Type.PORT_DESCRIPTION:
+        if tlv_type != _T_PORT_DESC:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
-
-        if not len(data) == length + 2:
+        if len(data) != length + 2:
             raise ValueError
 
-        tlv = PortDescriptionTLV(data[2:len(data)].decode('utf-8'))
-        return tlv
+        return PortDescriptionTLV._from_payload(memoryview(data)[2:])
+
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        return PortDescriptionTLV(str(payload, 'utf-8'))
 
 
 class SystemDescriptionTLV(TLV):
@@ -105,26 +107,14 @@ class SystemDescriptionTLV(TLV):
                                                 0 - 255 byte
     """
 
+    __slots__ = ()
+
     def __init__(self, description: str):
         self.type = TLV.Type.SYSTEM_DESCRIPTION
+        self.subtype = None
         self.value = description
-        self.bytes = bytearray(description, 'utf-8')
-
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self.bytes = description.encode('utf-8')
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -138,25 +128,35 @@ class SystemDescriptionTLV(TLV):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
 
-        if not tlv_type == TLV.Type.SYSTEM_DESCRIPTION:
+        if tlv_type != _T_SYS_DESC:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
-
-        if not len(data) == length + 2:
+        if len(data) != length + 2:
             raise ValueError
 
-        tlv = SystemDescriptionTLV(data[2:len(data)].decode('utf-8'))
-        return tlv
+        return SystemDescriptionTLV._from_payload(memoryview(data)[2:])
+
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        return SystemDescriptionTLV(str(payload, 'utf-8'))
 
 
 class SystemNameTLV(TLV):
@@ -184,26 +184,14 @@ class SystemNameTLV(TLV):
                                                         0 - 255 byte
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str):
         self.type = TLV.Type.SYSTEM_NAME
+        self.subtype = None
         self.value = name
-        self.bytes = bytearray(name, 'utf-8')
-
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self.bytes = name.encode('utf-8')
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -217,22 +205,32 @@ class SystemNameTLV(TLV):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
 
-        if not tlv_type == TLV.Type.SYSTEM_NAME:
+        if tlv_type != _T_SYS_NAME:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
-
-        if not len(data) == length + 2:
+        if len(data) != length + 2:
             raise ValueError
 
-        tlv = SystemNameTLV(data[2:len(data)].decode('utf-8'))
-        return tlv
+        return SystemNameTLV._from_payload(memoryview(data)[2:])
+
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        return SystemNameTLV(str(payload, 'utf-8'))
@@ -1,8 +1,18 @@
 from enum import IntEnum
+import functools
+import operator
 
-from lldp.tlv import TLV
+from lldp.tlv import TLV, _parse_header
 import struct
 
+_T_SYS_CAPS = int(TLV.Type.SYSTEM_CAPABILITIES)
+
+_CAPS_STRUCT = struct.Struct("!HH")
+"""Precompiled format of the supported and enabled capability bitmaps"""
+
+_CAPS32 = struct.Struct("!I")
+"""Precompiled format of both capability bitmaps read as one 32 bit value, supported in the upper half"""
+
 
 class SystemCapabilitiesTLV(TLV):
     """System Capabilities TLV
@@ -56,6 +66,8 @@ class SystemCapabilitiesTLV(TLV):
         field indicates is enabled, the TLV will be interpreted as containing an error and a ValueError is raised.
     """
 
+    __slots__ = ('_supported', '_enabled')
+
     class Capability(IntEnum):
         """Capability bit values
 
@@ -81,6 +93,12 @@ class SystemCapabilitiesTLV(TLV):
         def __repr__(self):
             return repr(self.value)
 
+    _VALID_MASK = functools.reduce(operator.or_, Capability)
+    """All capability bits defined by `Capability`, every other bit is reserved"""
+
+    _DEFAULT_BYTES = _CAPS_STRUCT.pack(Capability.STATION_ONLY, Capability.STATION_ONLY)
+    """Packed value of the default station only capabilities, shared by all instances using them"""
+
     def __init__(self, supported: int = 128, enabled: int = 128):
         """Constructor
 
@@ -88,58 +106,94 @@ class SystemCapabilitiesTLV(TLV):
             supported (int): Bitmap of supported capabilities
             enabled (int): Bitmap of enabled capabilities
         """
-        if not enabled | supported == supported:
+        if (supported | enabled) & ~self._VALID_MASK:
             raise ValueError
+        self._check_enabled(supported, enabled)
         self.type = TLV.Type.SYSTEM_CAPABILITIES
-        self.value = enabled | (supported << 16)
-        self.bytes = self.value.to_bytes(4, 'big', signed=False)
-
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self.subtype = None
+        self._supported = supported
+        self._enabled = enabled
+        self.value = (supported << 16) | enabled
+        if supported == enabled == SystemCapabilitiesTLV.Capability.STATION_ONLY:
+            self.bytes = self._DEFAULT_BYTES
+        else:
+            self.bytes = _CAPS_STRUCT.pack(supported, enabled)
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
 
         See `TLV.__repr__()` for more information.
         """
-        return f"SystemCapabilitiesTLV({(self.value >> 16) & 0xFFFF}, {self.value & 0xFFFF})"
+        return "SystemCapabilitiesTLV(%d, %d)" % (self._supported, self._enabled)
 
     @staticmethod
     def from_bytes(data: TLV.ByteType):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
+
+        if tlv_type != _T_SYS_CAPS:
+            raise ValueError
 
-        if not tlv_type == TLV.Type.SYSTEM_CAPABILITIES:
+        if len(data) != length + 2:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
+        return SystemCapabilitiesTLV._from_payload(memoryview(data)[2:])
 
-        if not len(data) == length + 2:
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        if len(payload) != 4:
             raise ValueError
 
-        tlv = SystemCapabilitiesTLV((struct.unpack_from("!H", data, 2))[0], (struct.unpack_from("!H", data, 4))[0])
+        packed = bytes(payload)
+        raw, = _CAPS32.unpack(packed)
+        return SystemCapabilitiesTLV._from_raw(raw, packed)
+
+    @staticmethod
+    def _check_enabled(supported: int, enabled: int):
+        """Raise a `ValueError` if a capability is enabled but not supported."""
+        if enabled & ~supported:
+            raise ValueError
+
+    @classmethod
+    def _from_raw(cls, raw: int, packed: bytes):
+        """Create a TLV instance from both capability bitmaps as read off the wire.
+
+        The wire layout matches `value`, so `raw` is stored as is and only split into the two bitmaps. `packed` holds
+        the same four bytes and is kept as the TLV value.
+
+        Reserved bits are accepted, so capabilities defined after this implementation do not make a peer's LLDPDU
+        unreadable. Raises a `ValueError` if a capability is enabled but not supported.
+        """
+        supported = raw >> 16
+        enabled = raw & 0xFFFF
+        cls._check_enabled(supported, enabled)
+        tlv = cls.__new__(cls)
+        tlv.type = TLV.Type.SYSTEM_CAPABILITIES
+        tlv.subtype = None
+        tlv._supported = supported
+        tlv._enabled = enabled
+        tlv.value = raw
+        tlv.bytes = packed
+        tlv._pack()
         return tlv
 
     def supports(self, capabilities: int):
@@ -147,11 +201,11 @@ class SystemCapabilitiesTLV(TLV):
 
         Multiple capabilities should be ORed together.
         """
-        return (capabilities | ((self.value >> 16) & 0xFFFF)) == (self.value >> 16) & 0xFFFF
+        return (capabilities & ~self._supported) == 0
 
     def enabled(self, capabilities: int):
         """Check if the system has a given capability enabled.
 
         Multiple capabilities should be ORed together.
         """
-        return (capabilities | (self.value & 0xFFFF)) == self.value & 0xFFFF
+        return (capabilities & ~self._enabled) == 0
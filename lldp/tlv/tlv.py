@@ -3,6 +3,25 @@ from typing import TypeVar, Tuple
 import struct
 
 
+_HEADER_STRUCT = struct.Struct("!H")
+"""Precompiled format of the 16 bit TLV header"""
+
+
+def _parse_header(data) -> Tuple[int, int]:
+    """Return the raw type and length fields of a packed TLV.
+
+    Params:
+        data (bytes, bytearray or memoryview): The packed TLV
+
+    Raises a `ValueError` if `data` is too short to hold a TLV header.
+    """
+    try:
+        header, = _HEADER_STRUCT.unpack_from(data)
+    except struct.error:
+        raise ValueError(f"TLV header requires 2 bytes, got {len(data)}")
+    return header >> 9, header & 0x1FF
+
+
 class TLV(object):
     """TLV Base class
 
@@ -23,6 +42,8 @@ class TLV(object):
         value (depends on type and subtype)
     """
 
+    __slots__ = ('type', 'subtype', 'value', 'bytes', '_packed', '_plen')
+
     ByteType = TypeVar("ByteType", bytes, bytearray)
     """Either bytes or bytearray
 
@@ -47,10 +68,8 @@ class TLV(object):
         def __repr__(self):
             return repr(self.value)
 
-    type = None
-    subtype = None
-    value = None
-    bytes = None
+    _PAYLOAD_DISPATCH = {}
+    """Maps raw TLV types to the _from_payload() method of the respective subclass, filled in by `lldp.tlv`"""
 
     @staticmethod
     def get_type(data: ByteType) -> Type:
@@ -63,7 +82,7 @@ class TLV(object):
         """
 
         # Extract the type value from `data`
-        typevalue = (data[0] >> 1) & 0x7F
+        typevalue, _ = _parse_header(data)
 
         # Return the proper type enum or raise an error
         try:
@@ -80,7 +99,8 @@ class TLV(object):
         Params:
             data (bytes or bytearray): The packed TLV
         """
-        return ((data[0] & 1) << 8) | data[1]
+        _, length = _parse_header(data)
+        return length
 
     @staticmethod
     def from_bytes(data: ByteType) -> 'TLV':
@@ -126,6 +146,22 @@ class TLV(object):
         self.subtype = None
         self.value = None
         self.bytes = None
+        self._packed = None
+        self._plen = 0
+
+    def _pack(self):
+        """Pack the TLV header and value and cache the result.
+
+        Subclasses call this at the end of their constructor, once `type` and `bytes` are set. `__bytes__()` then
+        returns the cached representation instead of packing the TLV again on every call.
+
+        Raises a `ValueError` if the value does not fit into the 9 bit length field.
+        """
+        length = len(self.bytes)
+        if length > 511:
+            raise ValueError
+        self._packed = _HEADER_STRUCT.pack((self.type << 9) | length) + bytes(self.bytes)
+        self._plen = length + 2
 
     def __bytes__(self) -> bytes:
         """Return the byte representation of the TLV.
@@ -145,9 +181,7 @@ class TLV(object):
         Note:
             This method must return bytes. Returning a bytearray will raise a TypeError.
         """
-        tlv_bytes_hdr = struct.pack("!BB", (self.type << 1) | (self.__len__() >> 8) & 1, self.__len__() & 0xFF)
-        tlv_bytes = bytes(bytearray(tlv_bytes_hdr) + bytearray(self.bytes))
-        return tlv_bytes
+        return self._packed
 
     def __len__(self) -> int:
         """Return the length of the TLV value.
@@ -1,6 +1,11 @@
-from lldp.tlv import TLV
+from lldp.tlv import TLV, _parse_header
 import struct
 
+_T_TTL = int(TLV.Type.TTL)
+
+_TTL_STRUCT = struct.Struct("!H")
+"""Precompiled format of the TTL value"""
+
 
 class TTLTLV(TLV):
     """Time To Live TLV
@@ -27,28 +32,17 @@ class TTLTLV(TLV):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, ttl: int):
-        if ttl > 65535:
-            raise ValueError
         self.type = TLV.Type.TTL
-        self.bytes = ttl.to_bytes(2, byteorder='big')
+        self.subtype = None
+        try:
+            self.bytes = _TTL_STRUCT.pack(ttl)
+        except struct.error:
+            raise ValueError
         self.value = ttl
-
-    def __bytes__(self):
-        """Return the byte representation of the TLV.
-
-        This method must return bytes. Returning a bytearray will raise a TypeError.
-        See `TLV.__bytes__()` for more information.
-        """
-        return super().__bytes__()
-
-    def __len__(self):
-        """Return the length of the TLV value.
-
-        This method must return an int. Returning anything else will raise a TypeError.
-        See `TLV.__len__()` for more information.
-        """
-        return super().__len__()
+        self._pack()
 
     def __repr__(self):
         """Return a printable representation of the TLV object.
@@ -62,25 +56,35 @@ class TTLTLV(TLV):
         """Create a TLV instance from raw bytes.
 
         Args:
-            data (bytes or bytearray): The packed TLV
+            data (bytes, bytearray or memoryview): The packed TLV
 
         Raises a `ValueError` if the provided TLV contains errors (e.g. has the wrong type).
         """
         if len(data) < 2:
             raise ValueError
 
-        tlv_type = (data[0] >> 1) & 0x7F
+        tlv_type, length = _parse_header(data)
 
-        if not tlv_type == TLV.Type.TTL:
+        if tlv_type != _T_TTL:
             raise ValueError
 
-        length = ((data[0] & 1) << 8) | data[1]
-
-        if not len(data) == length + 2:
+        if len(data) != length + 2:
             raise ValueError
 
-        if not length == 2:
+        return TTLTLV._from_payload(memoryview(data)[2:])
+
+    @staticmethod
+    def _from_payload(payload: TLV.ByteType):
+        """Create a TLV instance from the value of a packed TLV.
+
+        The TLV header has already been checked by the caller, see `from_bytes()`.
+
+        Args:
+            payload (bytes, bytearray or memoryview): The TLV value without the header
+
+        Raises a `ValueError` if the value contains errors.
+        """
+        if len(payload) != 2:
             raise ValueError
 
-        tlv = TTLTLV((struct.unpack_from("!H", data, 2))[0])
-        return tlv
+        return TTLTLV((payload[0] << 8) | payload[1])
@@ -9,4 +9,5 @@ from .portid_tlv import *
 from .systemcapabilities_tlv import *
 from .systemdescription_tlv import *
 from .systemname_tlv import *
+from .tlv import *
 from .ttl_tlv import *
@@ -67,6 +67,70 @@ class LLDPAgentTests(unittest.TestCase):
         self.assertEqual(a.socket.family, socket.AF_PACKET)
         self.assertEqual(a.socket.proto, 768)
 
+    def test_socket_filter(self):
+        a = LLDPAgent(b"\xAA\xBB\xCC\xDD\xEE\xFF", interface_name="lo")
+        sending_socket = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(0x0003))
+        sending_socket.bind(("lo", 0))
+
+        # IPv4 ethertype, has to be dropped by the socket filter
+        sending_socket.send(binascii.unhexlify('0180c200000effeeddccbbaa0800450000140000000040000000'))
+        sending_socket.send(binascii.unhexlify('0180c200000effeeddccbbaa88cc020704ffeeddccbbaa040703ffeeddccbbaa060200780000'))
+        sending_socket.close()
+
+        frames = a.receive()
+        a.socket.close()
+        self.assertGreater(len(frames), 0)
+        for frame in frames:
+            self.assertEqual(frame[12:14], b"\x88\xcc")
+
+    def test_receive_injected_socket(self):
+        s = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(0x0003))
+        s.bind(("lo", 0))
+        a = LLDPAgent(b"\xAA\xBB\xCC\xDD\xEE\xFF", interface_name="lo", sock=s)
+
+        # Distinct frames, differing in their TTL, so that overwritten receive buffers are noticed
+        header = binascii.unhexlify('0180c200000effeeddccbbaa88cc020704ffeeddccbbaa040703ffeeddccbbaa0602')
+        msgs = [header + ttl.to_bytes(2, 'big') + b"\x00\x00" for ttl in range(40)]
+        for msg in msgs:
+            s.send(msg)
+
+        # Returned frames are only valid until the next call, copy them before receiving again
+        first = [bytes(frame) for frame in a.receive()]
+        frames = list(first)
+        batch = a.receive(wait=False)
+        while batch:
+            frames += [bytes(frame) for frame in batch]
+            batch = a.receive(wait=False)
+        s.close()
+
+        self.assertGreater(len(first), 1)
+        for msg in msgs:
+            self.assertEqual(frames.count(msg), 1)
+
+    def test_run_zero_interval(self):
+        msg = binascii.unhexlify('0180c200000effeeddccbbaa88cc020704ffeeddccbbaa040703ffeeddccbbaa060200780000')
+
+        def deferred_send():
+            time.sleep(0.5)
+            sending_socket = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(0x0003))
+            sending_socket.bind(("lo", 0))
+            sending_socket.send(msg)
+            sending_socket.close()
+
+        s = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(0x0003))
+        s.bind(("lo", 0))
+        agent = LLDPAgent(b"\xAA\xBB\xCC\xDD\xEE\xFF", interface_name="lo", interval=0, sock=s, logger=MockLogger())
+        announcements = []
+        agent.announce = lambda: announcements.append(time.time())
+
+        peer = multiprocessing.Process(target=deferred_send, daemon=True)
+        peer.start()
+        agent.run(run_once=True)
+        peer.join()
+
+        # The agent must keep announcing while waiting for the frame instead of blocking in receive()
+        self.assertGreater(len(announcements), 1)
+
     def test_run(self):
         interface = "lo"
         logger = MockLogger()
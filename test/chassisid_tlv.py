@@ -106,3 +106,7 @@ class ChassisIdTLVTests(unittest.TestCase):
     def test_chassisid_load_invalid_ipv6(self):
         with self.assertRaises(ValueError):
             ChassisIdTLV.from_bytes(b"\x02\x10\x05\x20\x01\x00\xdb\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00")
+
+    def test_chassisid_load_invalid_subtype(self):
+        with self.assertRaises(ValueError):
+            ChassisIdTLV.from_bytes(b"\x02\x05\x08test")
@@ -135,3 +135,35 @@ class LLDPDUTests(unittest.TestCase):
         self.assertTrue(hasattr(du, "__len__"))
         self.assertIsInstance(du.__len__(), int)
         self.assertEqual(len(du), 5)
+
+    def test_load_all_types(self):
+        du_bytes = (b"\x02\x07\x04\xff\xee\xdd\xcc\xbb\xaa" +
+                    b"\x04\x06\x04\x01\x0a\x00\x00\x01" +
+                    b"\x06\x02\x00\x78" +
+                    b"\x08\x04eth0" +
+                    b"\x0a\x07Voyager" +
+                    b"\x0c\x0bEngineering" +
+                    b"\x0e\x04\x00\x14\x00\x04" +
+                    b"\x10\x0c\x05\x01\xc0\x00\x02\x01\x02\x00\x00\x00\x05\x00" +
+                    b"\xfe\x07\xaa\xbb\xcc\x1aabc" +
+                    b"\x00\x00")
+        du = LLDPDU.from_bytes(bytearray(du_bytes))
+
+        self.assertEqual(len(du), 10)
+        self.assertTrue(du.complete())
+        self.assertEqual(bytes(du), du_bytes)
+        self.assertEqual(du[3].value, "eth0")
+        self.assertEqual(du[8].oui, b"\xaa\xbb\xcc")
+
+    def test_load_truncated_header(self):
+        with self.assertRaises(ValueError):
+            LLDPDU.from_bytes(b"\x02\x07\x04\x00\x22\x12\xAA\xBB\xCC\x04")
+
+    def test_load_reserved_capability(self):
+        du = LLDPDU.from_bytes(b"\x02\x07\x04\x00\x22\x12\xAA\xBB\xCC" +
+                               b"\x04\x07\x03\x00\x22\x12\xAA\xBB\xCC" +
+                               b"\x06\x02\x00\x78" +
+                               b"\x0e\x04\x08\x00\x00\x00" +
+                               b"\x00\x00")
+        self.assertEqual(len(du), 5)
+        self.assertTrue(du[3].supports(0x0800))
@@ -90,3 +90,12 @@ class ManagementAddressTLVTests(unittest.TestCase):
     def test_load_zero_oid(self):
         tlv = ManagementAddressTLV.from_bytes(b"\x10\x0C\x05\x01\xC0\x00\x02*\x03\x00\x00\x00\x01\x00")
         self.assertEqual(tlv.oid, None)
+
+    def test_load_truncated(self):
+        for data in (b"\x10\x00", b"\x10\x02\x05\x01", b"\x10\x08\x05\x01\xC0\x00\x02*\x03\x00"):
+            with self.assertRaises(ValueError):
+                ManagementAddressTLV.from_bytes(data)
+
+    def test_load_trailing_bytes(self):
+        with self.assertRaises(ValueError):
+            ManagementAddressTLV.from_bytes(b"\x10\x0D\x05\x01\xC0\x00\x02*\x03\x00\x00\x00\x01\x00\xFF")
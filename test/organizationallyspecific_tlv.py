@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import copy
+import pickle
 import unittest
 from lldp.tlv import TLV, OrganizationallySpecificTLV
 
@@ -38,3 +40,13 @@ class OrganizationallySpecificTLVTests(unittest.TestCase):
         self.assertEqual(tlv.value, b"0118 999 88199 9119 725 3")
         self.assertEqual(tlv.oui, b"\xAA\xBB\xCC")
         self.assertEqual(tlv.subtype, b"\x1A")
+
+    def test_organizationallyspecific_invalid_oui(self):
+        with self.assertRaises(ValueError):
+            OrganizationallySpecificTLV(oui=b"\xAA\xBB", subtype=self.subtype, value=self.data)
+
+    def test_organizationallyspecific_copy(self):
+        for tlv in (copy.copy(self.tlv), copy.deepcopy(self.tlv), pickle.loads(pickle.dumps(self.tlv))):
+            self.assertEqual(tlv.oui, self.oui)
+            self.assertEqual(tlv.subtype, self.subtype)
+            self.assertEqual(bytes(tlv), bytes(self.tlv))
@@ -76,6 +76,19 @@ class SystemCapabilitiesTLVTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             SystemCapabilitiesTLV(supported=caps.STATION_ONLY, enabled=caps.WLAN_AP)
 
+    def test_reserved_capability(self):
+        with self.assertRaises(ValueError):
+            SystemCapabilitiesTLV(supported=0x0800, enabled=0)
+
+    def test_load_short(self):
+        with self.assertRaises(ValueError):
+            SystemCapabilitiesTLV.from_bytes(b"\x0e\x02\x00\x14")
+
+    def test_load_reserved_capability(self):
+        tlv = SystemCapabilitiesTLV.from_bytes(b"\x0e\x04\x08\x14\x00\x04")
+        self.assertTrue(tlv.supports(0x0800))
+        self.assertEqual(bytes(tlv), b"\x0e\x04\x08\x14\x00\x04")
+
     def test_load_capability_mismatch(self):
         with self.assertRaises(ValueError):
             SystemCapabilitiesTLV.from_bytes(b"\x0e\x04\x00\x00\x00\x14")
@@ -30,3 +30,7 @@ class SystemNameTLVTests(unittest.TestCase):
         tlv = SystemNameTLV.from_bytes(b"\x0A\x14AnotherUnittestAgain")
         self.assertEqual(len(tlv), 20)
         self.assertEqual(tlv.value, "AnotherUnittestAgain")
+
+    def test_systemname_too_long(self):
+        with self.assertRaises(ValueError):
+            SystemNameTLV("x" * 512)
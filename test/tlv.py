@@ -0,0 +1,20 @@
+import unittest
+from lldp.tlv import TLV, TTLTLV, OrganizationallySpecificTLV
+
+
+class TLVTests(unittest.TestCase):
+    def test_construct_base(self):
+        tlv = TLV(TLV.Type.TTL, b"ab")
+        self.assertIsNone(tlv.type)
+        self.assertIsNone(tlv.subtype)
+        self.assertIsNone(tlv.value)
+        self.assertIsNone(tlv.bytes)
+
+    def test_load_short(self):
+        for data in (b"", b"\x00", b"\x06"):
+            with self.assertRaises(ValueError):
+                TLV.from_bytes(data)
+
+    def test_no_instance_dict(self):
+        for tlv in (TLV(TLV.Type.TTL, b"ab"), TTLTLV(120), OrganizationallySpecificTLV(b"\xAA\xBB\xCC", b"\x01", b"")):
+            self.assertFalse(hasattr(tlv, "__dict__"))
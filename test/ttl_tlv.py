@@ -29,6 +29,10 @@ class TTLTLVTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.tlv = TTLTLV(65539)
 
+    def test_negative_ttl(self):
+        with self.assertRaises(ValueError):
+            self.tlv = TTLTLV(-1)
+
     def test_dump(self):
         self.assertEqual(bytes(self.tlv), b"\x06\x02" + self.ttl.to_bytes(2, 'big'))
 